@@ -46,6 +46,8 @@ Usage (with approval):
     agent = Agent(..., toolsets=[approved])
 """
 
+from typing import TYPE_CHECKING, Any
+
 from .sandbox import (
     # Configuration
     Mount,
@@ -69,10 +71,19 @@ from .toolset import (
     DEFAULT_MAX_READ_CHARS,
 )
 
-from .approval_toolset import (
-    # Approvable toolset
-    ApprovableFileSystemToolset,
-)
+if TYPE_CHECKING:
+    from .approval_toolset import ApprovableFileSystemToolset
+
+
+def __getattr__(name: str) -> Any:
+    # Import the approval toolset on first use, so plain FileSystemToolset users
+    # don't pay for importing pydantic-ai-blocking-approval.
+    if name == "ApprovableFileSystemToolset":
+        from .approval_toolset import ApprovableFileSystemToolset
+
+        return ApprovableFileSystemToolset
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __version__ = "0.9.0"
 
@@ -28,7 +28,8 @@ Example:
 """
 from __future__ import annotations
 
-from typing import Any
+from operator import attrgetter
+from typing import Any, Callable, Literal
 
 from pydantic_ai.tools import RunContext
 from pydantic_ai_blocking_approval import (
@@ -37,8 +38,57 @@ from pydantic_ai_blocking_approval import (
     needs_approval_from_config,
 )
 
-from .sandbox import PathNotInSandboxError, PathNotWritableError
-from .toolset import FileSystemToolset
+from .sandbox import (
+    Mount,
+    PathNotInSandboxError,
+    PathNotWritableError,
+    Sandbox,
+    SandboxError,
+)
+from .toolset import _LIST_ROOT_ALIASES, FileSystemToolset
+
+_LOOKUP_CACHE_SIZE = 1024
+"""Maximum number of (path, op) approval lookups memoized per toolset."""
+
+_LOOKUP_CACHE_MAX_PATH = 256
+"""Longer paths are looked up without memoizing the verdict."""
+
+# ApprovalResult is a frozen dataclass, so the argument-less verdicts can be
+# shared instead of allocated on every needs_approval() call.
+_PRE_APPROVED = ApprovalResult.pre_approved()
+_NEEDS_APPROVAL = ApprovalResult.needs_approval()
+
+
+# Access op -> the Mount flag that makes that access need approval
+_APPROVAL_FLAG: dict[str, Callable[[Mount], bool]] = {
+    "read": attrgetter("read_approval"),
+    "write": attrgetter("write_approval"),
+}
+
+# Blocked-result messages, formatted with (label, path)
+_BLOCKED_MESSAGES: dict[type[SandboxError], Callable[[str, str], str]] = {
+    PathNotInSandboxError: "{} not in any mount: {}".format,
+    PathNotWritableError: "{} is read-only: {}".format,
+}
+_MSG_MISSING_ARG = "Missing required '{}' argument for {}".format
+
+# Tool name -> approval prompt formatter, used by get_approval_description()
+_DESCRIBERS: dict[str, Callable[[dict[str, Any]], str]] = {
+    "write_file": lambda a: (
+        f"Write {len(a.get('content', ''))} chars to {a.get('path', '/')}"
+    ),
+    "read_file": lambda a: f"Read from {a.get('path', '/')}",
+    "edit_file": lambda a: (
+        f"Edit {a.get('path', '/')}: replace {len(a.get('old_text', ''))} chars "
+        f"with {len(a.get('new_text', ''))} chars"
+    ),
+    "list_files": lambda a: (
+        f"List file paths in {a.get('path', '/')} matching {a.get('pattern', '**/*')}"
+    ),
+    "delete_file": lambda a: f"Delete {a.get('path', '/')}",
+    "move_file": lambda a: f"Move {a.get('source', '')} to {a.get('destination', '')}",
+    "copy_file": lambda a: f"Copy {a.get('source', '')} to {a.get('destination', '')}",
+}
 
 
 class ApprovableFileSystemToolset(FileSystemToolset):
@@ -59,6 +109,97 @@ class ApprovableFileSystemToolset(FileSystemToolset):
         approved = ApprovalToolset(inner=toolset, approval_callback=my_callback)
     """
 
+    # Tool name -> ((argument, op, label), ...) checked by needs_approval().
+    # Every argument must resolve for `op`; the call needs approval if any of
+    # the resolved mounts has the matching read/write approval flag set.
+    # list_files is not listed: its path is optional and "/" spans all mounts.
+    _APPROVAL_SPEC: dict[str, tuple[tuple[str, Literal["read", "write"], str], ...]] = {
+        "read_file": (("path", "read", "Path"),),
+        "write_file": (("path", "write", "Path"),),
+        "edit_file": (("path", "write", "Path"),),
+        "delete_file": (("path", "write", "Path"),),
+        # move_file removes the source, so it needs write access there
+        "move_file": (
+            ("source", "write", "Source"),
+            ("destination", "write", "Destination"),
+        ),
+        "copy_file": (
+            ("source", "read", "Source"),
+            ("destination", "write", "Destination"),
+        ),
+    }
+
+    def __init__(
+        self,
+        sandbox: Sandbox,
+        id: str | None = None,
+        max_retries: int = 1,
+    ):
+        """Initialize the approvable file system toolset.
+
+        Args:
+            sandbox: Sandbox for permission checking and path resolution
+            id: Optional toolset ID for durable execution
+            max_retries: Maximum number of retries for tool calls (default: 1)
+        """
+        super().__init__(sandbox, id=id, max_retries=max_retries)
+        # Memoize (path, op) -> outcome. Mounts are fixed after Sandbox
+        # construction, so the outcome is stable. Only the approval verdict is
+        # cached: call_tool() re-resolves the path before doing any I/O, so host
+        # filesystem changes are still enforced. A plain dict (not lru_cache)
+        # keeps the toolset picklable.
+        self._lookup_cache: dict[
+            tuple[str, Literal["read", "write"]], Mount | type[SandboxError]
+        ] = {}
+
+    def _lookup(
+        self, path: str, op: Literal["read", "write"]
+    ) -> Mount | type[SandboxError]:
+        """Look up the mount config for a path, memoized per toolset.
+
+        Uses the sandbox's non-raising lookup, so a blocked path costs no
+        exception construction. Paths come from the model, so the cache is
+        bounded by _LOOKUP_CACHE_SIZE and only holds paths up to
+        _LOOKUP_CACHE_MAX_PATH characters. It may be used from several
+        threads: a full cache is emptied with clear() rather than evicting
+        one key, which two threads could race on.
+
+        Returns:
+            The Mount, or the SandboxError subclass get_path_config() would raise
+        """
+        if len(path) > _LOOKUP_CACHE_MAX_PATH:
+            return self._lookup_uncached(path, op)
+        key = (path, op)
+        cache = self._lookup_cache
+        outcome = cache.get(key)
+        if outcome is None:
+            outcome = self._lookup_uncached(path, op)
+            if len(cache) >= _LOOKUP_CACHE_SIZE:
+                cache.clear()
+            cache[key] = outcome
+        return outcome
+
+    def _lookup_uncached(
+        self, path: str, op: Literal["read", "write"]
+    ) -> Mount | type[SandboxError]:
+        """Unmemoized _lookup()."""
+        result = self._sandbox._lookup(path, op)
+        return result[2] if isinstance(result, tuple) else result
+
+    def _resolve(
+        self, path: str, op: Literal["read", "write"], label: str = "Path"
+    ) -> tuple[Mount | None, ApprovalResult | None]:
+        """Resolve a path for approval checking.
+
+        Returns:
+            (mount_config, None) if the path is accessible, otherwise
+            (None, blocked ApprovalResult) with a message using `label`.
+        """
+        outcome = self._lookup(path, op)
+        if isinstance(outcome, Mount):
+            return outcome, None
+        return None, ApprovalResult.blocked(_BLOCKED_MESSAGES[outcome](label, path))
+
     def needs_approval(
         self,
         name: str,
@@ -84,144 +225,44 @@ class ApprovableFileSystemToolset(FileSystemToolset):
         if base.is_pre_approved:
             return base
 
-        # Tools that require 'path' argument
-        path_required_tools = {"write_file", "read_file", "edit_file", "delete_file"}
-        if name in path_required_tools and "path" not in tool_args:
-            return ApprovalResult.blocked(f"Missing required 'path' argument for {name}")
-
-        path = tool_args.get("path", "/")
-
-        if name == "write_file":
-            try:
-                _, _, config = self._sandbox.get_path_config(path, op="write")
-            except PathNotInSandboxError:
-                return ApprovalResult.blocked(f"Path not in any mount: {path}")
-            except PathNotWritableError:
-                return ApprovalResult.blocked(f"Path is read-only: {path}")
-
-            if not config.write_approval:
-                return ApprovalResult.pre_approved()
-
-            return ApprovalResult.needs_approval()
-
-        elif name == "read_file":
-            try:
-                _, _, config = self._sandbox.get_path_config(path, op="read")
-            except PathNotInSandboxError:
-                return ApprovalResult.blocked(f"Path not in any mount: {path}")
-
-            if not config.read_approval:
-                return ApprovalResult.pre_approved()
-
-            return ApprovalResult.needs_approval()
-
-        elif name == "edit_file":
-            try:
-                _, _, config = self._sandbox.get_path_config(path, op="write")
-            except PathNotInSandboxError:
-                return ApprovalResult.blocked(f"Path not in any mount: {path}")
-            except PathNotWritableError:
-                return ApprovalResult.blocked(f"Path is read-only: {path}")
-
-            if not config.write_approval:
-                return ApprovalResult.pre_approved()
-
-            return ApprovalResult.needs_approval()
-
-        elif name == "list_files":
-            list_path = tool_args.get("path", "/")
-            if list_path in ("/", ".", ""):
-                for root_virtual in self._sandbox.readable_roots:
-                    try:
-                        _, _, config = self._sandbox.get_path_config(
-                            root_virtual, op="read"
-                        )
-                    except PathNotInSandboxError:
-                        continue
-                    if config.read_approval:
-                        return ApprovalResult.needs_approval()
-                return ApprovalResult.pre_approved()
-
-            try:
-                _, _, config = self._sandbox.get_path_config(list_path, op="read")
-            except PathNotInSandboxError:
-                return ApprovalResult.blocked(f"Path not in any mount: {list_path}")
-
-            if config.read_approval:
-                return ApprovalResult.needs_approval()
-            return ApprovalResult.pre_approved()
-
-        elif name == "delete_file":
-            try:
-                _, _, config = self._sandbox.get_path_config(path, op="write")
-            except PathNotInSandboxError:
-                return ApprovalResult.blocked(f"Path not in any mount: {path}")
-            except PathNotWritableError:
-                return ApprovalResult.blocked(f"Path is read-only: {path}")
-
-            if not config.write_approval:
-                return ApprovalResult.pre_approved()
-
-            return ApprovalResult.needs_approval()
-
-        elif name == "move_file":
-            if "source" not in tool_args:
-                return ApprovalResult.blocked("Missing required 'source' argument for move_file")
-            if "destination" not in tool_args:
-                return ApprovalResult.blocked("Missing required 'destination' argument for move_file")
-            source = tool_args["source"]
-            destination = tool_args["destination"]
-
-            # Check source
-            try:
-                _, _, src_config = self._sandbox.get_path_config(source, op="write")
-            except PathNotInSandboxError:
-                return ApprovalResult.blocked(f"Source not in any mount: {source}")
-            except PathNotWritableError:
-                return ApprovalResult.blocked(f"Source is read-only: {source}")
-
-            # Check destination
-            try:
-                _, _, dst_config = self._sandbox.get_path_config(destination, op="write")
-            except PathNotInSandboxError:
-                return ApprovalResult.blocked(f"Destination not in any mount: {destination}")
-            except PathNotWritableError:
-                return ApprovalResult.blocked(f"Destination is read-only: {destination}")
-
-            if not src_config.write_approval and not dst_config.write_approval:
-                return ApprovalResult.pre_approved()
-
-            return ApprovalResult.needs_approval()
-
-        elif name == "copy_file":
-            if "source" not in tool_args:
-                return ApprovalResult.blocked("Missing required 'source' argument for copy_file")
-            if "destination" not in tool_args:
-                return ApprovalResult.blocked("Missing required 'destination' argument for copy_file")
-            source = tool_args["source"]
-            destination = tool_args["destination"]
-
-            # Check source (only needs read)
-            try:
-                _, _, src_config = self._sandbox.get_path_config(source, op="read")
-            except PathNotInSandboxError:
-                return ApprovalResult.blocked(f"Source not in any mount: {source}")
-
-            # Check destination
-            try:
-                _, _, dst_config = self._sandbox.get_path_config(destination, op="write")
-            except PathNotInSandboxError:
-                return ApprovalResult.blocked(f"Destination not in any mount: {destination}")
-            except PathNotWritableError:
-                return ApprovalResult.blocked(f"Destination is read-only: {destination}")
-
-            if not src_config.read_approval and not dst_config.write_approval:
-                return ApprovalResult.pre_approved()
-
-            return ApprovalResult.needs_approval()
-
-        # Unknown tool - require approval
-        return ApprovalResult.needs_approval()
+        spec = self._APPROVAL_SPEC.get(name)
+        if spec is None:
+            if name == "list_files":
+                return self._list_files_approval(tool_args.get("path", "/"))
+            # Unknown tool - require approval
+            return _NEEDS_APPROVAL
+
+        paths = [tool_args.get(arg) for arg, _, _ in spec]
+        for (arg, _, _), path in zip(spec, paths):
+            if path is None:
+                return ApprovalResult.blocked(_MSG_MISSING_ARG(arg, name))
+
+        resolve = self._resolve
+        requires_approval = False
+        for (_, op, label), path in zip(spec, paths):
+            mount, blocked = resolve(path, op, label)
+            if blocked is not None:
+                return blocked
+            requires_approval = requires_approval or _APPROVAL_FLAG[op](mount)
+
+        if requires_approval:
+            return _NEEDS_APPROVAL
+        return _PRE_APPROVED
+
+    def _list_files_approval(self, path: str) -> ApprovalResult:
+        """Approval check for list_files, whose root path spans every mount."""
+        if path in _LIST_ROOT_ALIASES:
+            if self._sandbox.any_root_needs_read_approval:
+                return _NEEDS_APPROVAL
+            return _PRE_APPROVED
+
+        mount, blocked = self._resolve(path, "read")
+        if blocked is not None:
+            return blocked
+
+        if mount.read_approval:
+            return _NEEDS_APPROVAL
+        return _PRE_APPROVED
 
     def get_approval_description(
         self, name: str, tool_args: dict[str, Any], ctx: RunContext[Any]
@@ -238,36 +279,7 @@ class ApprovableFileSystemToolset(FileSystemToolset):
         Returns:
             Description string to show user
         """
-        path = tool_args.get("path", "/")
-
-        if name == "write_file":
-            content = tool_args.get("content", "")
-            char_count = len(content)
-            return f"Write {char_count} chars to {path}"
-
-        elif name == "read_file":
-            return f"Read from {path}"
-
-        elif name == "edit_file":
-            old_text = tool_args.get("old_text", "")
-            new_text = tool_args.get("new_text", "")
-            return f"Edit {path}: replace {len(old_text)} chars with {len(new_text)} chars"
-
-        elif name == "list_files":
-            pattern = tool_args.get("pattern", "**/*")
-            return f"List file paths in {path} matching {pattern}"
-
-        elif name == "delete_file":
-            return f"Delete {path}"
-
-        elif name == "move_file":
-            source = tool_args.get("source", "")
-            destination = tool_args.get("destination", "")
-            return f"Move {source} to {destination}"
-
-        elif name == "copy_file":
-            source = tool_args.get("source", "")
-            destination = tool_args.get("destination", "")
-            return f"Copy {source} to {destination}"
-
-        return f"{name}({path})"
+        describe = _DESCRIBERS.get(name)
+        if describe is None:
+            return f"{name}({tool_args.get('path', '/')})"
+        return describe(tool_args)
@@ -10,12 +10,25 @@ For file operations, use FileSystemToolset which wraps a Sandbox.
 """
 from __future__ import annotations
 
+import os
 import posixpath
 import re
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Iterable, Literal, NamedTuple, Optional, Union
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+
+_MOUNT_CACHE_SIZE = 1024
+"""Maximum number of virtual path -> mount lookups memoized per sandbox tree."""
+
+_MOUNT_CACHE_MAX_PATH = 256
+"""Longer virtual paths are looked up without being memoized."""
+
+_REPEATED_SLASHES = re.compile(r"/{2,}")
+
+_MISSING = object()
+"""Cache-miss sentinel; None is a valid cached _find_mount() result."""
 
 
 # ---------------------------------------------------------------------------
@@ -34,6 +47,8 @@ class Mount(BaseModel):
         # Host /home/user/docs/file.txt -> sandbox /docs/file.txt
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     host_path: Path = Field(description="Host directory path to mount")
     mount_point: str = Field(
         description="Where to mount in virtual filesystem (e.g., '/docs', '/data')"
@@ -41,9 +56,12 @@ class Mount(BaseModel):
     mode: Literal["ro", "rw"] = Field(
         default="ro", description="Access mode: 'ro' (read-only) or 'rw' (read-write)"
     )
-    suffixes: Optional[list[str]] = Field(
+    suffixes: Optional[tuple[str, ...]] = Field(
         default=None,
-        description="Allowed file suffixes (e.g., ['.md', '.txt']). None means all allowed.",
+        description=(
+            "Allowed file suffixes (e.g., ['.md', '.txt']; stored as a tuple). "
+            "None means all allowed."
+        ),
     )
     max_file_bytes: Optional[int] = Field(
         default=None, description="Maximum file size in bytes. None means no limit."
@@ -57,16 +75,17 @@ class Mount(BaseModel):
         description="Whether reads from this mount require approval",
     )
 
-    @model_validator(mode="after")
-    def _validate_mount_point(self) -> "Mount":
-        mount_point = self.mount_point.replace("\\", "/").strip()
+    @field_validator("mount_point")
+    @classmethod
+    def _validate_mount_point(cls, value: str) -> str:
+        mount_point = value.replace("\\", "/").strip()
         if "\x00" in mount_point:
             raise ValueError("mount_point must not contain null bytes")
         if not mount_point:
             mount_point = "/"
         if not mount_point.startswith("/"):
-            raise ValueError(f"mount_point must start with '/': {self.mount_point!r}")
-        mount_point = re.sub(r"/{2,}", "/", mount_point)
+            raise ValueError(f"mount_point must start with '/': {value!r}")
+        mount_point = _REPEATED_SLASHES.sub("/", mount_point)
         mount_point = posixpath.normpath(mount_point)
         if mount_point in (".", "/."):
             mount_point = "/"
@@ -75,12 +94,11 @@ class Mount(BaseModel):
         parts = [p for p in mount_point.split("/") if p]
         if any(p in (".", "..") for p in parts):
             raise ValueError(
-                f"mount_point must not contain '.' or '..' segments: {self.mount_point!r}"
+                f"mount_point must not contain '.' or '..' segments: {value!r}"
             )
         if not mount_point.startswith("/"):
             mount_point = "/" + mount_point
-        self.mount_point = mount_point
-        return self
+        return mount_point
 
 
 class SandboxConfig(BaseModel):
@@ -93,8 +111,10 @@ class SandboxConfig(BaseModel):
         ])
     """
 
-    mounts: list[Mount] = Field(
-        description="List of directory mounts",
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    mounts: tuple[Mount, ...] = Field(
+        description="Directory mounts (a list is accepted and stored as a tuple)",
     )
 
     @model_validator(mode="after")
@@ -197,6 +217,34 @@ class EditError(SandboxError):
 # ---------------------------------------------------------------------------
 
 
+class _MountEntry(NamedTuple):
+    """A configured mount with its host directory resolved.
+
+    The string forms of the host directory are computed once at setup for
+    the containment checks in Sandbox._resolve_within(), the mount's mode
+    once for write checks, and its lowercased suffixes for check_suffix().
+    """
+
+    mount_point: str
+    host_path: Path
+    mount: Mount
+    host_root: str
+    """str(host_path)."""
+    host_prefix: str
+    """host_root with a trailing os.sep."""
+    writable: bool
+    """mount.mode == "rw"."""
+    suffix_set: Optional[frozenset[str]]
+    """_lowercase_suffixes(mount.suffixes)."""
+
+
+def _lowercase_suffixes(suffixes: Optional[Iterable[str]]) -> Optional[frozenset[str]]:
+    """Lowercased allowed suffixes for set lookups, or None if all are allowed."""
+    if suffixes is None:
+        return None
+    return frozenset(s.lower() for s in suffixes)
+
+
 class Sandbox:
     """Security boundary for file access validation.
 
@@ -222,14 +270,35 @@ class Sandbox:
             # ... perform write operation
     """
 
+    # derive() creates a Sandbox per child; slots keep those small
+    __slots__ = (
+        "config",
+        "_base_path",
+        "_mounts",
+        "_mount_index",
+        "_mount_lengths",
+        "_parent",
+        "_allowed_read",
+        "_allowed_write",
+        "_any_root_needs_read_approval",
+        "_find_mount_cache",
+        "_readable_roots",
+        "_writable_roots",
+        "_effective_read",
+        "_effective_write",
+        "_denies_all_read",
+        "_denies_all_write",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         config: SandboxConfig,
         base_path: Optional[Path] = None,
         *,
         _parent: Optional["Sandbox"] = None,
-        _allowed_read: Optional[list[tuple[str, Path, str]]] = None,
-        _allowed_write: Optional[list[tuple[str, Path, str]]] = None,
+        _allowed_read: Optional[list[tuple[str, str, str]]] = None,
+        _allowed_write: Optional[list[tuple[str, str, str]]] = None,
     ):
         """Initialize the sandbox.
 
@@ -239,21 +308,58 @@ class Sandbox:
         """
         self.config = config
         self._base_path = base_path or Path.cwd()
-        # List of (mount_point, resolved_host_path, Mount)
-        self._mounts: list[tuple[str, Path, Mount]] = []
+        # Mount entries, longest mount point first; immutable once set up,
+        # and shared with derived sandboxes
+        self._mounts: tuple[_MountEntry, ...] = ()
+        # mount_point -> entry of self._mounts, for longest-prefix lookup
+        self._mount_index: dict[str, _MountEntry] = {}
+        # Distinct lengths of the non-root mount points, longest first
+        self._mount_lengths: tuple[int, ...] = ()
 
         self._parent: Optional[Sandbox] = _parent
-        # Allowlists: list of (mount_point, host_path, label) tuples
+        # Allowlists: list of (mount_point, host_prefix, label) tuples
         # None = inherit from parent (or allow all if root sandbox)
         # [] = no access
-        self._allowed_read: Optional[list[tuple[str, Path, str]]] = _allowed_read
-        self._allowed_write: Optional[list[tuple[str, Path, str]]] = _allowed_write
+        self._allowed_read: Optional[list[tuple[str, str, str]]] = _allowed_read
+        self._allowed_write: Optional[list[tuple[str, str, str]]] = _allowed_write
+        # Lazily computed by any_root_needs_read_approval
+        self._any_root_needs_read_approval: Optional[bool] = None
 
         if self._parent is None:
             self._setup_mounts()
+            # Memoized _find_mount results, shared with derived sandboxes. Mount
+            # matching is pure string work on a fixed mount table, so it is
+            # safe to cache; host path resolution in get_path_config() is not
+            # cached. A plain dict (not lru_cache) keeps the sandbox picklable.
+            self._find_mount_cache: dict[str, Optional[tuple[_MountEntry, str]]] = {}
         else:
             # Inherit mount configuration from parent for nested derivation
             self._mounts = self._parent._mounts
+            self._mount_index = self._parent._mount_index
+            self._mount_lengths = self._parent._mount_lengths
+            self._find_mount_cache = self._parent._find_mount_cache
+
+        # Mounts and allowlists are fixed from here on, so the roots reported
+        # in error messages are computed once.
+        self._readable_roots = self._compute_readable_roots()
+        self._writable_roots = self._compute_writable_roots()
+        # The allowlists actually in force, with inheritance (None) resolved
+        # through the parent chain once here instead of on every check. An
+        # explicit child allowlist is validated against the parent in
+        # derive(), so it never needs intersecting with the parent's.
+        # Each is stored as mount_point -> tuple of host prefixes, so one
+        # str.startswith(tuple) call tests every entry for a mount.
+        self._effective_read = self._group_allowlist(self._allowed_read)
+        self._effective_write = self._group_allowlist(self._allowed_write)
+        if self._parent is not None:
+            if self._effective_read is None:
+                self._effective_read = self._parent._effective_read
+            if self._effective_write is None:
+                self._effective_write = self._parent._effective_write
+        # An empty effective allowlist (e.g. derive(readonly=True)) denies
+        # every path; the predicates below answer without resolving anything.
+        self._denies_all_read = self._effective_read == {}
+        self._denies_all_write = self._effective_write == {}
 
     def _setup_mounts(self) -> None:
         """Resolve and validate configured mounts."""
@@ -270,11 +376,8 @@ class Sandbox:
         # Resolve mount directories
         resolved_mounts: list[tuple[str, Path, Mount]] = []
         for mount in mounts:
-            host_path = Path(mount.host_path)
-            if not host_path.is_absolute():
-                host_path = (self._base_path / host_path).resolve()
-            else:
-                host_path = host_path.resolve()
+            # Joining onto base_path leaves absolute host paths unchanged
+            host_path = (self._base_path / mount.host_path).resolve()
             resolved_mounts.append((mount.mount_point, host_path, mount))
 
         # Disallow overlapping host paths (prevents the same host file being reachable
@@ -299,13 +402,30 @@ class Sandbox:
                         f"{mp_a!r} maps to {str(hp_a)!r} and {mp_b!r} maps to {str(hp_b)!r}"
                     )
 
-        # Create mount directories
-        for mount_point, host_path, mount in resolved_mounts:
-            host_path.mkdir(parents=True, exist_ok=True)
-            self._mounts.append((mount_point, host_path, mount))
+        # Create missing mount directories (one stat() when they already exist;
+        # mkdir(exist_ok=True) would fail with EEXIST and then stat anyway)
+        for _, host_path, _ in resolved_mounts:
+            if not host_path.is_dir():
+                host_path.mkdir(parents=True, exist_ok=True)
 
         # Sort by mount_point length descending (longest prefix first)
-        self._mounts.sort(key=lambda x: len(x[0]), reverse=True)
+        resolved_mounts.sort(key=lambda x: len(x[0]), reverse=True)
+        self._mounts = tuple(
+            _MountEntry(
+                mount_point,
+                host_path,
+                mount,
+                str(host_path),
+                str(host_path).rstrip(os.sep) + os.sep,
+                mount.mode == "rw",
+                _lowercase_suffixes(mount.suffixes),
+            )
+            for mount_point, host_path, mount in resolved_mounts
+        )
+        self._mount_index = {entry.mount_point: entry for entry in self._mounts}
+        self._mount_lengths = tuple(
+            sorted({len(mp) for mp in self._mount_index if mp != "/"}, reverse=True)
+        )
 
     # ---------------------------------------------------------------------------
     # Path Resolution
@@ -314,32 +434,49 @@ class Sandbox:
     _AccessOp = Literal["read", "write"]
 
     def _normalize_path(self, path: str) -> str:
+        """Normalize a virtual path, raising for paths that can never match.
+
+        Raises:
+            PathNotInSandboxError: If the path is rejected by _try_normalize_path
+        """
+        normalized = self._try_normalize_path(path)
+        if normalized is None:
+            raise PathNotInSandboxError(path, self.readable_roots)
+        return normalized
+
+    @staticmethod
+    def _try_normalize_path(path: str) -> Optional[str]:
         """Normalize a virtual path for security validation.
 
+        Returns None for paths that are rejected outright (NUL bytes, "~",
+        Windows drive letters).
+
         Note: This method and _normalize_virtual_path_for_display share similar
         logic but serve different purposes. This method is used in the security
         pipeline and intentionally does NOT use posixpath.normpath() because '..'
-        traversal is handled later by _resolve_within() which uses Path.resolve()
-        and validates containment. The display method uses normpath() to produce
-        clean paths for error messages only.
+        traversal is handled later by _resolve_within(), which resolves the host
+        path with os.path.realpath() and validates containment with a string
+        prefix test. The display method uses normpath() to produce clean paths
+        for error messages only.
         """
         normalized = path.replace("\\", "/").strip()
         if not normalized:
             return "/"
         if "\x00" in normalized:
-            raise PathNotInSandboxError(path, self.readable_roots)
+            return None
         if normalized in (".", "/."):
             return "/"
         # Reject dangerous patterns
         if normalized.startswith("~"):
-            raise PathNotInSandboxError(path, self.readable_roots)
+            return None
         # Handle Windows drive letters
         if len(normalized) >= 2 and normalized[1] == ":":
-            raise PathNotInSandboxError(path, self.readable_roots)
+            return None
         # Ensure path starts with /
         if not normalized.startswith("/"):
             normalized = "/" + normalized
-        normalized = re.sub(r"/{2,}", "/", normalized)
+        if "//" in normalized:
+            normalized = _REPEATED_SLASHES.sub("/", normalized)
         return normalized
 
     def _normalize_virtual_path_for_display(self, path: str) -> str:
@@ -355,7 +492,7 @@ class Sandbox:
             return "/"
         if not normalized.startswith("/"):
             normalized = "/" + normalized
-        normalized = re.sub(r"/{2,}", "/", normalized)
+        normalized = _REPEATED_SLASHES.sub("/", normalized)
         normalized = posixpath.normpath(normalized)
         if normalized in (".", "/."):
             return "/"
@@ -363,65 +500,82 @@ class Sandbox:
             normalized = "/" + normalized
         return normalized
 
-    def _find_mount(self, path: str) -> tuple[str, Path, Mount]:
+    def _cached_find_mount(self, path: str) -> Optional[tuple[_MountEntry, str]]:
+        """Memoized _find_mount(), bounded by _MOUNT_CACHE_SIZE.
+
+        Paths come from the model, so the cache is bounded in entries and
+        only holds paths up to _MOUNT_CACHE_MAX_PATH characters. It is shared
+        by the whole sandbox tree and may be used from several threads: each
+        step is a single dict operation, and a full cache is emptied with
+        clear() rather than evicting one key, which two threads could race on.
+        """
+        if len(path) > _MOUNT_CACHE_MAX_PATH:
+            return self._find_mount(path)
+        cache = self._find_mount_cache
+        found = cache.get(path, _MISSING)
+        if found is _MISSING:
+            found = self._find_mount(path)
+            if len(cache) >= _MOUNT_CACHE_SIZE:
+                cache.clear()
+            cache[path] = found
+        return found
+
+    def _find_mount(self, path: str) -> Optional[tuple[_MountEntry, str]]:
         """Find the mount that contains this path.
 
+        Callers go through _cached_find_mount(), which memoizes this.
+
         Args:
             path: Virtual path (e.g., "/docs/file.txt")
 
         Returns:
-            Tuple of (mount_point, host_path, mount_config)
-
-        Raises:
-            PathNotInSandboxError: If path is not in any mount
+            Tuple of (mount entry, relative), where relative is the normalized
+            path below the mount point without a leading "/", or None if the
+            path is invalid or not in any mount
         """
-        if self._parent is not None:
-            return self._parent._find_mount(path)
-
-        normalized = self._normalize_path(path)
-
-        # Find the most specific (longest) matching mount point
-        best_match: tuple[str, Path, Mount] | None = None
-        best_length = -1
-
-        for mount_point, host_path, mount in self._mounts:
-            if mount_point == "/":
-                # Root mount matches everything, but with lowest priority
-                if best_match is None:
-                    best_match = (mount_point, host_path, mount)
-                    best_length = 0
-            elif normalized == mount_point or normalized.startswith(mount_point + "/"):
-                # More specific mount takes precedence
-                if len(mount_point) > best_length:
-                    best_match = (mount_point, host_path, mount)
-                    best_length = len(mount_point)
-
-        if best_match is not None:
-            return best_match
-
-        raise PathNotInSandboxError(path, self.readable_roots)
+        normalized = self._try_normalize_path(path)
+        if normalized is None:
+            return None
 
-    def _resolve_within(self, host_path: Path, relative: str, *, virtual_path: str) -> Path:
-        """Resolve a relative path within a host path, preventing escapes.
+        # Find the most specific (longest) matching mount point. Only prefixes
+        # as long as some mount point and ending at a segment boundary can
+        # match, so the cost is bounded by the number of distinct mount-point
+        # lengths, not by how deep the (model-supplied) path is. The root
+        # mount "/" is matched last, with lowest priority.
+        lookup = self._mount_index.get
+        for length in self._mount_lengths:
+            if normalized[length : length + 1] in ("", "/"):
+                entry = lookup(normalized[:length])
+                if entry is not None:
+                    # Normalized paths have no "//", so slicing off the mount
+                    # point and its separator leaves no leading slash.
+                    return entry, normalized[length + 1 :]
+        entry = lookup("/")
+        if entry is not None:
+            return entry, normalized[1:]
+        return None
+
+    @staticmethod
+    def _resolve_within(entry: _MountEntry, relative: str) -> Optional[str]:
+        """Resolve a relative path within a mount's host path, preventing escapes.
 
         Args:
-            host_path: The host directory
-            relative: Relative path within the mount
+            entry: The mount the path belongs to
+            relative: Relative path within the mount, without a leading "/"
 
         Returns:
-            Resolved absolute path
-
-        Raises:
-            PathNotInSandboxError: If resolved path escapes the host_path
+            Resolved absolute host path as a string, or None if it escapes
+            the host_path
         """
-        relative = relative.lstrip("/")
         if not relative:
-            return host_path
-        candidate = (host_path / relative).resolve()
-        try:
-            candidate.relative_to(host_path)
-        except ValueError:
-            raise PathNotInSandboxError(virtual_path, self.readable_roots)
+            return entry.host_root
+        # Same resolution as Path.resolve(), done on strings: the containment
+        # check is a prefix test instead of Path.relative_to(). Symlinks are
+        # still resolved on every call; see docs/notes/path-lookup-performance.md.
+        prefix = entry.host_prefix
+        candidate = os.path.realpath(prefix + relative)
+        if not candidate.startswith(prefix) and candidate != entry.host_root:
+            return None
         return candidate
 
     def resolve(self, path: str) -> Path:
@@ -455,10 +609,43 @@ class Sandbox:
         Raises:
             PathNotInSandboxError: If mount_point is not a valid mount
         """
-        for mp, host_path, _ in self._mounts:
-            if mp == mount_point:
-                return host_path
-        raise PathNotInSandboxError(mount_point, self.readable_roots)
+        entry = self._mount_index.get(mount_point)
+        if entry is None:
+            raise PathNotInSandboxError(mount_point, self.readable_roots)
+        return entry.host_path
+
+    def _lookup(
+        self, path: str, op: _AccessOp
+    ) -> Union[tuple[str, Path, Mount], type[SandboxError]]:
+        """Non-raising core of get_path_config().
+
+        Returns the (mount_point, resolved_host_path, mount_config) tuple, or
+        the SandboxError subclass get_path_config() would raise. The boolean
+        predicates below use this directly so a denied path costs no
+        exception (or error message) construction.
+        """
+        found = self._cached_find_mount(path)
+        if found is None:
+            return PathNotInSandboxError
+        entry, relative = found
+        mount_point = entry.mount_point
+
+        resolved = self._resolve_within(entry, relative)
+        if resolved is None:
+            return PathNotInSandboxError
+
+        if op == "write" and not entry.writable:
+            return PathNotWritableError
+
+        # Check allowlists (for root sandbox, these return True; for derived, they check)
+        probe = resolved + os.sep
+        if op == "read":
+            if not self._matches_allowlist(self._effective_read, mount_point, probe):
+                return PathNotInSandboxError
+        elif not self._matches_allowlist(self._effective_write, mount_point, probe):
+            return PathNotWritableError
+
+        return mount_point, Path(resolved), entry.mount
 
     def get_path_config(self, path: str, *, op: _AccessOp) -> tuple[str, Path, Mount]:
         """Get mount point, resolved path, and config for a path.
@@ -473,30 +660,14 @@ class Sandbox:
 
         Raises:
             PathNotInSandboxError: If path is not in any mount
+            PathNotWritableError: If op is "write" and the path is not writable
         """
-        mount_point, host_path, mount = self._find_mount(path)
-        normalized = self._normalize_path(path)
-
-        # Extract relative part
-        if mount_point == "/":
-            relative = normalized[1:]
-        else:
-            relative = normalized[len(mount_point) :]
-
-        resolved = self._resolve_within(host_path, relative, virtual_path=path)
-
-        if op == "write" and mount.mode != "rw":
+        result = self._lookup(path, op)
+        if isinstance(result, tuple):
+            return result
+        if result is PathNotWritableError:
             raise PathNotWritableError(path, self.writable_roots)
-
-        # Check allowlists (for root sandbox, these return True; for derived, they check)
-        if op == "read":
-            if not self._is_allowed_for_read(mount_point, resolved):
-                raise PathNotInSandboxError(path, self.readable_roots)
-        else:
-            if not self._is_allowed_for_write(mount_point, resolved):
-                raise PathNotWritableError(path, self.writable_roots)
-
-        return mount_point, resolved, mount
+        raise PathNotInSandboxError(path, self.readable_roots)
 
     # ---------------------------------------------------------------------------
     # Permission Checking
@@ -504,35 +675,56 @@ class Sandbox:
 
     def can_read(self, path: str) -> bool:
         """Check if path is readable within sandbox boundaries."""
-        try:
-            self.get_path_config(path, op="read")
-            return True
-        except SandboxError:
+        if self._denies_all_read:
             return False
+        return isinstance(self._lookup(path, "read"), tuple)
 
     def can_write(self, path: str) -> bool:
         """Check if path is writable within sandbox boundaries."""
-        try:
-            self.get_path_config(path, op="write")
-            return True
-        except SandboxError:
+        if self._denies_all_write:
             return False
+        return isinstance(self._lookup(path, "write"), tuple)
+
+    def check_paths(
+        self, paths: Iterable[str], *, op: _AccessOp
+    ) -> list[Optional[tuple[str, Path, Mount]]]:
+        """Check many paths for the same operation in one call.
+
+        Equivalent to calling get_path_config() on each path, but returns
+        None for a denied path instead of raising, and hoists the per-call
+        setup out of the loop.
+
+        Args:
+            paths: Virtual paths to check
+            op: Operation to check for ("read" or "write")
+
+        Returns:
+            One entry per path, in order: the (mount_point, resolved_host_path,
+            mount_config) tuple if allowed, else None
+        """
+        denies_all = self._denies_all_read if op == "read" else self._denies_all_write
+        if denies_all:
+            return [None for _ in paths]
+        lookup = self._lookup
+        results: list[Optional[tuple[str, Path, Mount]]] = []
+        for path in paths:
+            result = lookup(path, op)
+            results.append(result if isinstance(result, tuple) else None)
+        return results
 
     def needs_read_approval(self, path: str) -> bool:
         """Check if reading this path requires approval."""
-        try:
-            _, _, mount = self.get_path_config(path, op="read")
-            return mount.read_approval
-        except SandboxError:
+        if self._denies_all_read:
             return False
+        result = self._lookup(path, "read")
+        return isinstance(result, tuple) and result[2].read_approval
 
     def needs_write_approval(self, path: str) -> bool:
         """Check if writing this path requires approval."""
-        try:
-            _, _, mount = self.get_path_config(path, op="write")
-            return mount.write_approval
-        except SandboxError:
+        if self._denies_all_write:
             return False
+        result = self._lookup(path, "write")
+        return isinstance(result, tuple) and result[2].write_approval
 
     # ---------------------------------------------------------------------------
     # Boundary Info
@@ -541,27 +733,47 @@ class Sandbox:
     @property
     def readable_roots(self) -> list[str]:
         """List of readable paths (for error messages)."""
+        return list(self._readable_roots)
+
+    @property
+    def writable_roots(self) -> list[str]:
+        """List of writable paths (for error messages)."""
+        return list(self._writable_roots)
+
+    def _compute_readable_roots(self) -> list[str]:
         if self._parent is not None:
             if self._allowed_read is None:
-                return self._parent.readable_roots
+                return self._parent._readable_roots
             # Extract unique labels from allowlist, preserving order
             return list(dict.fromkeys(lbl for _, _, lbl in self._allowed_read))
-        return [mount_point for mount_point, _, _ in self._mounts]
+        return [entry.mount_point for entry in self._mounts]
 
-    @property
-    def writable_roots(self) -> list[str]:
-        """List of writable paths (for error messages)."""
+    def _compute_writable_roots(self) -> list[str]:
         if self._parent is not None:
             if self._allowed_write is None:
-                return self._parent.writable_roots
+                return self._parent._writable_roots
             # Extract unique labels from allowlist, preserving order
             return list(dict.fromkeys(lbl for _, _, lbl in self._allowed_write))
         return [
-            mount_point
-            for mount_point, _, mount in self._mounts
-            if mount.mode == "rw"
+            entry.mount_point
+            for entry in self._mounts
+            if entry.writable
         ]
 
+    @property
+    def any_root_needs_read_approval(self) -> bool:
+        """Whether reading any readable root requires approval.
+
+        Answers the approval question for listing "/", which spans every
+        readable root. Mounts and allowlists are fixed after construction,
+        so the result is computed once.
+        """
+        if self._any_root_needs_read_approval is None:
+            self._any_root_needs_read_approval = any(
+                self.needs_read_approval(root) for root in self.readable_roots
+            )
+        return self._any_root_needs_read_approval
+
     # ---------------------------------------------------------------------------
     # Derivation
     # ---------------------------------------------------------------------------
@@ -632,14 +844,17 @@ class Sandbox:
 
     def _resolve_allowlist_entries(
         self, entries: Optional[list[str]], *, op: _AccessOp
-    ) -> Optional[list[tuple[str, Path, str]]]:
-        """Resolve allowlist entries to (mount_point, host_path, label) tuples."""
+    ) -> Optional[list[tuple[str, str, str]]]:
+        """Resolve allowlist entries to (mount_point, host_prefix, label) tuples."""
         if entries is None:
             return None
         return [self._resolve_allow_prefix(entry, op=op) for entry in entries]
 
-    def _resolve_allow_prefix(self, entry: str, *, op: _AccessOp) -> tuple[str, Path, str]:
-        """Resolve an allowlist entry to (mount_point, host_path, label).
+    def _resolve_allow_prefix(self, entry: str, *, op: _AccessOp) -> tuple[str, str, str]:
+        """Resolve an allowlist entry to (mount_point, host_prefix, label).
+
+        host_prefix is the resolved host directory as a string ending in
+        os.sep, so matching a path against it is a single startswith().
 
         Args:
             entry: A virtual path to allow (must be a directory, not a file)
@@ -648,7 +863,7 @@ class Sandbox:
             ValueError: If entry contains '..' or points to a file
         """
         raw = entry.replace("\\", "/").strip()
-        if ".." in Path(raw).parts:
+        if ".." in raw.split("/"):
             raise ValueError(f"Allowlist entry must not contain '..': {entry!r}")
         normalized = self._normalize_path(entry)
 
@@ -663,40 +878,33 @@ class Sandbox:
             )
 
         label = normalized.rstrip("/") or "/"
-        return mount_point, resolved, label
+        return mount_point, str(resolved).rstrip(os.sep) + os.sep, label
 
-    def _matches_prefix(
-        self, mount_point: str, path: Path, prefix: tuple[str, Path, str]
+    @staticmethod
+    def _group_allowlist(
+        entries: Optional[list[tuple[str, str, str]]],
+    ) -> Optional[dict[str, tuple[str, ...]]]:
+        """Group allowlist entries into mount_point -> host prefixes."""
+        if entries is None:
+            return None
+        grouped: dict[str, tuple[str, ...]] = {}
+        for mount_point, host_prefix, _ in entries:  # Ignore label
+            grouped[mount_point] = grouped.get(mount_point, ()) + (host_prefix,)
+        return grouped
+
+    @staticmethod
+    def _matches_allowlist(
+        allowed: Optional[dict[str, tuple[str, ...]]], mount_point: str, probe: str
     ) -> bool:
-        """Check if path matches an allowlist prefix entry."""
-        prefix_mount, prefix_path, _ = prefix  # Ignore label
-        if prefix_mount != mount_point:
-            return False
-        try:
-            path.relative_to(prefix_path)
-            return True
-        except ValueError:
-            return False
-
-    def _is_allowed_for_read(self, mount_point: str, path: Path) -> bool:
-        if self._allowed_read is None:
-            # Inheriting from parent - check parent's permissions
-            if self._parent is not None:
-                return self._parent._is_allowed_for_read(mount_point, path)
-            return True  # Root sandbox with no restrictions
-        return any(
-            self._matches_prefix(mount_point, path, p) for p in self._allowed_read
-        )
+        """Check a path against a grouped allowlist.
 
-    def _is_allowed_for_write(self, mount_point: str, path: Path) -> bool:
-        if self._allowed_write is None:
-            # Inheriting from parent - check parent's permissions
-            if self._parent is not None:
-                return self._parent._is_allowed_for_write(mount_point, path)
-            return True  # Root sandbox with no restrictions
-        return any(
-            self._matches_prefix(mount_point, path, p) for p in self._allowed_write
-        )
+        probe is the resolved host path with os.sep appended, so an allowed
+        directory itself matches as well as everything below it.
+        """
+        if allowed is None:
+            return True  # No restrictions anywhere up the chain
+        prefixes = allowed.get(mount_point)
+        return prefixes is not None and probe.startswith(prefixes)
 
     # ---------------------------------------------------------------------------
     # Validation Helpers
@@ -719,11 +927,18 @@ class Sandbox:
         Raises:
             SuffixNotAllowedError: If suffix is not in allowed list
         """
-        if mount.suffixes is not None:
+        # Use the set precomputed for this sandbox's own mounts; any other
+        # Mount (e.g. a model_copy()) is checked against its own suffixes.
+        for entry in self._mounts:
+            if entry.mount is mount:
+                allowed = entry.suffix_set
+                break
+        else:
+            allowed = _lowercase_suffixes(mount.suffixes)
+        if allowed is not None:
             suffix = path.suffix.lower()
-            allowed = [s.lower() for s in mount.suffixes]
             if suffix not in allowed:
-                raise SuffixNotAllowedError(virtual_path, suffix, mount.suffixes)
+                raise SuffixNotAllowedError(virtual_path, suffix, list(mount.suffixes))
 
     def check_size(
         self,
@@ -731,6 +946,7 @@ class Sandbox:
         mount: Mount,
         *,
         virtual_path: str,
+        size: Optional[int] = None,
     ) -> None:
         """Check if file size is within limit.
 
@@ -738,11 +954,18 @@ class Sandbox:
             path: Resolved host path
             mount: Mount configuration
             virtual_path: Virtual path for error messages
+            size: File size in bytes, if the caller already has it from a
+                stat() call (skips stat-ing path again)
 
         Raises:
             FileTooLargeError: If file exceeds size limit
         """
-        if mount.max_file_bytes is not None and path.exists():
-            size = path.stat().st_size
-            if size > mount.max_file_bytes:
-                raise FileTooLargeError(virtual_path, size, mount.max_file_bytes)
+        if mount.max_file_bytes is None:
+            return
+        if size is None:
+            try:
+                size = path.stat().st_size
+            except (FileNotFoundError, NotADirectoryError):
+                return
+        if size > mount.max_file_bytes:
+            raise FileTooLargeError(virtual_path, size, mount.max_file_bytes)
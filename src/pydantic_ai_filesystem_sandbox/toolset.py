@@ -26,9 +26,14 @@ Example:
 """
 from __future__ import annotations
 
+import fnmatch
+import functools
+import os
+import re
 import shutil
+import stat
 from pathlib import Path
-from typing import Any, Literal, Optional
+from typing import Any, Iterable, Iterator, Literal, Optional
 
 from pydantic import BaseModel, Field, TypeAdapter
 from pydantic_ai.toolsets import AbstractToolset, ToolsetTool
@@ -38,8 +43,6 @@ from .sandbox import (
     EditError,
     FileTooLargeError,
     Mount,
-    PathNotInSandboxError,
-    PathNotWritableError,
     Sandbox,
     SandboxConfig,
     SandboxError,
@@ -54,6 +57,18 @@ from .sandbox import (
 DEFAULT_MAX_READ_CHARS = 20_000
 """Default maximum characters to read from a file."""
 
+_READ_CHUNK_CHARS = 1 << 16
+"""Characters decoded per chunk when reading a file."""
+
+_WRITE_CHUNK_CHARS = 1 << 16
+"""Characters encoded per chunk when writing a file."""
+
+_LIST_ROOT_ALIASES = frozenset(("/", ".", ""))
+"""list_files paths that mean "every readable mount"."""
+
+_LONE_SURROGATE = re.compile("[\ud800-\udfff]")
+"""The only characters a str can hold that UTF-8 cannot encode."""
+
 
 class ReadResult(BaseModel):
     """Result of reading a file from the sandbox."""
@@ -138,6 +153,80 @@ class CopyFileArgs(BaseModel):
     )
 
 
+_TOOL_SPECS: tuple[tuple[str, str, type[BaseModel]], ...] = (
+    (
+        "read_file",
+        "Read a text file from the sandbox. "
+        "Path format: '/mount/path' (e.g., '/docs/file.txt'). "
+        "Do not use this on binary files (PDFs, images, etc) - "
+        "pass them as attachments instead.",
+        ReadFileArgs,
+    ),
+    (
+        "write_file",
+        "Write a text file to the sandbox. "
+        "Parent directories are created automatically. "
+        "Path format: '/mount/path' (e.g., '/output/file.txt').",
+        WriteFileArgs,
+    ),
+    (
+        "list_files",
+        "List files in the sandbox matching a glob pattern. "
+        "Path format: '/mount' or '/mount/subdir'. "
+        "Use '/' to list all mounts.",
+        ListFilesArgs,
+    ),
+    (
+        "edit_file",
+        "Edit a file by replacing exact text. "
+        "The old_text must match exactly and appear only once. "
+        "Path format: '/mount/path' (e.g., '/output/file.txt').",
+        EditFileArgs,
+    ),
+    (
+        "delete_file",
+        "Delete a file from the sandbox. "
+        "Path format: '/mount/path' (e.g., '/output/file.txt').",
+        DeleteFileArgs,
+    ),
+    (
+        "move_file",
+        "Move or rename a file within the sandbox. "
+        "Parent directories of destination are created automatically. "
+        "Path format: '/mount/path' (e.g., '/output/file.txt').",
+        MoveFileArgs,
+    ),
+    (
+        "copy_file",
+        "Copy a file within the sandbox. "
+        "Parent directories of destination are created automatically. "
+        "Path format: '/mount/path' (e.g., '/output/file.txt').",
+        CopyFileArgs,
+    ),
+)
+"""(name, description, args model) for each tool, in get_tools() order."""
+
+
+@functools.cache
+def _tool_definitions() -> tuple[tuple[ToolDefinition, Any], ...]:
+    """Build each tool's definition and args validator once per process.
+
+    Schema generation and TypeAdapter compilation are the expensive part of
+    get_tools(); neither depends on the toolset instance.
+    """
+    return tuple(
+        (
+            ToolDefinition(
+                name=name,
+                description=description,
+                parameters_json_schema=args_model.model_json_schema(),
+            ),
+            TypeAdapter(args_model).validator,
+        )
+        for name, description, args_model in _TOOL_SPECS
+    )
+
+
 # ---------------------------------------------------------------------------
 # FileSystemToolset Implementation
 # ---------------------------------------------------------------------------
@@ -181,6 +270,8 @@ class FileSystemToolset(AbstractToolset[Any]):
         self._sandbox = sandbox
         self._toolset_id = id
         self._max_retries = max_retries
+        # Built on the first get_tools() call
+        self._tools: Optional[dict[str, ToolsetTool[Any]]] = None
 
     @staticmethod
     def _format_result_path(mount_point: str, rel: str | Path) -> str:
@@ -278,41 +369,61 @@ class FileSystemToolset(AbstractToolset[Any]):
 
         _, resolved, mount = self._sandbox.get_path_config(path, op="read")
 
-        if not resolved.exists():
+        # One stat() answers exists, is-a-file and size
+        try:
+            st = resolved.stat()
+        except (FileNotFoundError, NotADirectoryError):
             raise FileNotFoundError(f"File not found: {path}")
 
-        if not resolved.is_file():
+        if not stat.S_ISREG(st.st_mode):
             raise IsADirectoryError(f"Not a file: {path}")
 
         self._sandbox.check_suffix(resolved, mount, virtual_path=path)
-        self._sandbox.check_size(resolved, mount, virtual_path=path)
+        self._sandbox.check_size(resolved, mount, virtual_path=path, size=st.st_size)
 
         try:
-            text = resolved.read_text(encoding="utf-8")
+            text, total_chars = self._read_text_window(resolved, offset, max_chars)
         except UnicodeDecodeError:
             raise SandboxError(
                 f"Cannot read '{path}': file appears to be binary or not UTF-8 encoded.\n"
                 "This tool only reads text files. For binary files, pass them as attachments."
             )
-        total_chars = len(text)
-
-        # Apply offset
-        if offset > 0:
-            text = text[offset:]
-
-        # Apply max_chars limit
-        truncated = len(text) > max_chars
-        if truncated:
-            text = text[:max_chars]
 
-        return ReadResult(
+        # Every field is computed here with the right type; skip validation
+        return ReadResult.model_construct(
             content=text,
-            truncated=truncated,
+            truncated=total_chars - offset > max_chars,
             total_chars=total_chars,
             offset=offset,
             chars_read=len(text),
         )
 
+    @staticmethod
+    def _read_text_window(path: Path, offset: int, max_chars: int) -> tuple[str, int]:
+        """Read characters [offset, offset + max_chars) of a UTF-8 text file.
+
+        The file is decoded in chunks so memory stays proportional to the
+        window, not the file. The whole file is still decoded, which keeps
+        total_chars exact and rejects non-UTF-8 content anywhere in it.
+
+        Returns:
+            Tuple of (window text, total characters in file)
+
+        Raises:
+            UnicodeDecodeError: If the file is not valid UTF-8
+        """
+        end = offset + max_chars
+        pieces: list[str] = []
+        total_chars = 0
+        with path.open(encoding="utf-8") as f:
+            while chunk := f.read(_READ_CHUNK_CHARS):
+                start = max(offset - total_chars, 0)
+                stop = min(end - total_chars, len(chunk))
+                if start < stop:
+                    pieces.append(chunk[start:stop])
+                total_chars += len(chunk)
+        return "".join(pieces), total_chars
+
     def write(self, path: str, content: str) -> str:
         """Write text file to sandbox.
 
@@ -334,19 +445,62 @@ class FileSystemToolset(AbstractToolset[Any]):
 
         self._sandbox.check_suffix(resolved, mount, virtual_path=path)
 
-        # Check content size against limit
-        if mount.max_file_bytes is not None:
-            content_bytes = len(content.encode("utf-8"))
-            if content_bytes > mount.max_file_bytes:
-                raise FileTooLargeError(path, content_bytes, mount.max_file_bytes)
+        encoded = self._check_content_size(content, mount, virtual_path=path)
 
         # Create parent directories if needed
         resolved.parent.mkdir(parents=True, exist_ok=True)
 
-        resolved.write_text(content, encoding="utf-8")
+        self._write_text_chunked(resolved, content, encoded)
 
         return f"Written {len(content)} characters to {path}"
 
+    @staticmethod
+    def _check_content_size(
+        content: str, mount: Mount, *, virtual_path: str
+    ) -> Optional[bytes]:
+        """Check that content encoded as UTF-8 fits the mount's max_file_bytes.
+
+        UTF-8 uses at most 4 bytes per character, so content is only encoded
+        to measure it when it could actually exceed the limit.
+
+        Returns:
+            The encoded content if it had to be encoded to measure it, so the
+            write can reuse it; otherwise None
+
+        Raises:
+            FileTooLargeError: If the encoded content exceeds the limit
+            UnicodeEncodeError: If content cannot be encoded as UTF-8
+        """
+        limit = mount.max_file_bytes
+        if limit is None or len(content) * 4 <= limit:
+            return None
+        encoded = content.encode("utf-8")
+        if len(encoded) > limit:
+            raise FileTooLargeError(virtual_path, len(encoded), limit)
+        return encoded
+
+    @staticmethod
+    def _write_text_chunked(
+        path: Path, content: str, encoded: Optional[bytes] = None
+    ) -> None:
+        """Write content to path as UTF-8, encoding it in bounded chunks.
+
+        Unlike Path.write_text(), the full encoded copy of content is never
+        held in memory at once. No newline translation is applied. If encoded
+        is given (from _check_content_size()), it is written as is.
+
+        Content that cannot be encoded raises UnicodeEncodeError before the
+        file is opened, so a failed write never leaves a truncated file.
+        """
+        if encoded is not None:
+            path.write_bytes(encoded)
+            return
+        if _LONE_SURROGATE.search(content) is not None:
+            content.encode("utf-8")  # raises UnicodeEncodeError
+        with path.open("wb") as f:
+            for start in range(0, len(content), _WRITE_CHUNK_CHARS):
+                f.write(content[start : start + _WRITE_CHUNK_CHARS].encode("utf-8"))
+
     def edit(self, path: str, old_text: str, new_text: str) -> str:
         """Edit a file by replacing old_text with new_text.
 
@@ -373,10 +527,12 @@ class FileSystemToolset(AbstractToolset[Any]):
 
         self._sandbox.check_suffix(resolved, mount, virtual_path=path)
 
-        if not resolved.exists():
+        try:
+            st = resolved.stat()
+        except (FileNotFoundError, NotADirectoryError):
             raise FileNotFoundError(f"File not found: {path}")
 
-        self._sandbox.check_size(resolved, mount, virtual_path=path)
+        self._sandbox.check_size(resolved, mount, virtual_path=path, size=st.st_size)
 
         # Read current content
         try:
@@ -400,13 +556,9 @@ class FileSystemToolset(AbstractToolset[Any]):
         # Perform the replacement
         new_content = content.replace(old_text, new_text, 1)
 
-        # Check content size against limit
-        if mount.max_file_bytes is not None:
-            content_bytes = len(new_content.encode("utf-8"))
-            if content_bytes > mount.max_file_bytes:
-                raise FileTooLargeError(path, content_bytes, mount.max_file_bytes)
+        encoded = self._check_content_size(new_content, mount, virtual_path=path)
 
-        resolved.write_text(new_content, encoding="utf-8")
+        self._write_text_chunked(resolved, new_content, encoded)
 
         return f"Edited {path}: replaced {len(old_text)} chars with {len(new_text)} chars"
 
@@ -423,26 +575,21 @@ class FileSystemToolset(AbstractToolset[Any]):
         pattern = self._validate_glob_pattern(pattern)
 
         # If path is "/" or "." or empty, list all mounts
-        if path in ("/", ".", ""):
+        if path in _LIST_ROOT_ALIASES:
             results: set[str] = set()
             for root_virtual in self._sandbox.readable_roots:
                 mount_point, resolved, _ = self._sandbox.get_path_config(
                     root_virtual, op="read"
                 )
                 mount_root = self._sandbox.get_mount_root(mount_point)
-                if not resolved.exists():
-                    continue
-
-                for match in resolved.glob(pattern):
-                    if not match.is_file():
-                        continue
-                    try:
-                        rel = match.relative_to(mount_root)
-                    except ValueError:
-                        continue
-                    result_path = self._format_result_path(mount_point, rel)
-                    if self._sandbox.can_read(result_path):
-                        results.add(result_path)
+                results.update(
+                    self._readable_only(
+                        self._format_result_path(mount_point, rel)
+                        for rel in self._iter_matching_files(
+                            resolved, mount_root, pattern
+                        )
+                    )
+                )
             return sorted(results)
 
         # Get the resolved path and mount point
@@ -451,18 +598,84 @@ class FileSystemToolset(AbstractToolset[Any]):
         # Get mount root for relative path calculation (doesn't check allowlists)
         root = self._sandbox.get_mount_root(mount_point)
 
-        results = []
-        for match in resolved.glob(pattern):
-            if match.is_file():
+        return sorted(
+            self._readable_only(
+                self._format_result_path(mount_point, rel)
+                for rel in self._iter_matching_files(resolved, root, pattern)
+            )
+        )
+
+    def _readable_only(self, paths: Iterable[str]) -> list[str]:
+        """Filter virtual paths by read permission in one batch.
+
+        Respects derived sandbox allowlists and symlink containment, like
+        can_read(), without a method dispatch per path.
+        """
+        paths = list(paths)
+        checked = self._sandbox.check_paths(paths, op="read")
+        return [path for path, ok in zip(paths, checked) if ok is not None]
+
+    @classmethod
+    def _iter_matching_files(
+        cls, directory: Path, mount_root: Path, pattern: str
+    ) -> Iterator[str]:
+        """Yield files under directory matching pattern, relative to mount_root.
+
+        Patterns of the form "**/<name>" (including the default "**/*") are
+        served by a single scandir walk that matches each file name against
+        one compiled regex; other patterns go through Path.glob().
+        """
+        head, sep, name_glob = pattern.partition("/")
+        if head == "**" and sep and "/" not in name_glob and "**" not in name_glob:
+            base = directory.relative_to(mount_root).as_posix()
+            prefix = "" if base == "." else f"{base}/"
+            files = cls._walk_files(str(directory))
+            if name_glob == "*":
+                for rel in files:
+                    yield prefix + rel
+                return
+            # Same per-component match (and case folding) as Path.glob()
+            match_name = re.compile(fnmatch.translate(os.path.normcase(name_glob))).match
+            for rel in files:
+                if match_name(os.path.normcase(rel.rpartition("/")[2])):
+                    yield prefix + rel
+            return
+
+        for match in directory.glob(pattern):
+            if not match.is_file():
+                continue
+            try:
+                rel = match.relative_to(mount_root)
+            except ValueError:
+                continue
+            yield rel.as_posix()
+
+    @staticmethod
+    def _walk_files(root: str) -> Iterator[str]:
+        """Yield regular files below root as '/'-joined paths relative to root.
+
+        Equivalent to Path(root).glob("**/*") filtered by is_file(): symlinked
+        directories are not descended into, symlinks to files are included,
+        and unreadable directories are skipped. Uses the file type cached on
+        each DirEntry instead of a stat() per match.
+        """
+        pending = [""]
+        while pending:
+            rel_dir = pending.pop()
+            try:
+                with os.scandir(os.path.join(root, rel_dir)) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            for entry in entries:
+                rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
                 try:
-                    rel = match.relative_to(root)
-                    result_path = self._format_result_path(mount_point, rel)
-                    # Filter by read permission (respects derived sandbox allowlists)
-                    if self._sandbox.can_read(result_path):
-                        results.append(result_path)
-                except ValueError:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(rel)
+                    elif entry.is_file():
+                        yield rel
+                except OSError:
                     continue
-        return sorted(results)
 
     def delete(self, path: str) -> str:
         """Delete a file from the sandbox.
@@ -568,14 +781,19 @@ class FileSystemToolset(AbstractToolset[Any]):
             source, op="read"
         )
 
-        if not src_resolved.exists():
+        # One stat() answers exists, is-a-file and the size for both mounts
+        try:
+            src_st = src_resolved.stat()
+        except (FileNotFoundError, NotADirectoryError):
             raise FileNotFoundError(f"Source file not found: {source}")
 
-        if not src_resolved.is_file():
+        if not stat.S_ISREG(src_st.st_mode):
             raise IsADirectoryError(f"Cannot copy directory: {source}")
 
         self._sandbox.check_suffix(src_resolved, src_mount_cfg, virtual_path=source)
-        self._sandbox.check_size(src_resolved, src_mount_cfg, virtual_path=source)
+        self._sandbox.check_size(
+            src_resolved, src_mount_cfg, virtual_path=source, size=src_st.st_size
+        )
 
         # Check destination
         _, dst_resolved, dst_mount_cfg = self._sandbox.get_path_config(
@@ -588,10 +806,9 @@ class FileSystemToolset(AbstractToolset[Any]):
         self._sandbox.check_suffix(dst_resolved, dst_mount_cfg, virtual_path=destination)
 
         # Check size limit on destination
-        if dst_mount_cfg.max_file_bytes is not None:
-            src_size = src_resolved.stat().st_size
-            if src_size > dst_mount_cfg.max_file_bytes:
-                raise FileTooLargeError(destination, src_size, dst_mount_cfg.max_file_bytes)
+        self._sandbox.check_size(
+            dst_resolved, dst_mount_cfg, virtual_path=destination, size=src_st.st_size
+        )
 
         # Create parent directories if needed
         dst_resolved.parent.mkdir(parents=True, exist_ok=True)
@@ -612,114 +829,17 @@ class FileSystemToolset(AbstractToolset[Any]):
 
     async def get_tools(self, ctx: RunContext[Any]) -> dict[str, ToolsetTool[Any]]:
         """Return the tools provided by this toolset."""
-        tools = {}
-
-        tools["read_file"] = ToolsetTool(
-            toolset=self,
-            tool_def=ToolDefinition(
-                name="read_file",
-                description=(
-                    "Read a text file from the sandbox. "
-                    "Path format: '/mount/path' (e.g., '/docs/file.txt'). "
-                    "Do not use this on binary files (PDFs, images, etc) - "
-                    "pass them as attachments instead."
-                ),
-                parameters_json_schema=ReadFileArgs.model_json_schema(),
-            ),
-            max_retries=self._max_retries,
-            args_validator=TypeAdapter(ReadFileArgs).validator,
-        )
-
-        tools["write_file"] = ToolsetTool(
-            toolset=self,
-            tool_def=ToolDefinition(
-                name="write_file",
-                description=(
-                    "Write a text file to the sandbox. "
-                    "Parent directories are created automatically. "
-                    "Path format: '/mount/path' (e.g., '/output/file.txt')."
-                ),
-                parameters_json_schema=WriteFileArgs.model_json_schema(),
-            ),
-            max_retries=self._max_retries,
-            args_validator=TypeAdapter(WriteFileArgs).validator,
-        )
-
-        tools["list_files"] = ToolsetTool(
-            toolset=self,
-            tool_def=ToolDefinition(
-                name="list_files",
-                description=(
-                    "List files in the sandbox matching a glob pattern. "
-                    "Path format: '/mount' or '/mount/subdir'. "
-                    "Use '/' to list all mounts."
-                ),
-                parameters_json_schema=ListFilesArgs.model_json_schema(),
-            ),
-            max_retries=self._max_retries,
-            args_validator=TypeAdapter(ListFilesArgs).validator,
-        )
-
-        tools["edit_file"] = ToolsetTool(
-            toolset=self,
-            tool_def=ToolDefinition(
-                name="edit_file",
-                description=(
-                    "Edit a file by replacing exact text. "
-                    "The old_text must match exactly and appear only once. "
-                    "Path format: '/mount/path' (e.g., '/output/file.txt')."
-                ),
-                parameters_json_schema=EditFileArgs.model_json_schema(),
-            ),
-            max_retries=self._max_retries,
-            args_validator=TypeAdapter(EditFileArgs).validator,
-        )
-
-        tools["delete_file"] = ToolsetTool(
-            toolset=self,
-            tool_def=ToolDefinition(
-                name="delete_file",
-                description=(
-                    "Delete a file from the sandbox. "
-                    "Path format: '/mount/path' (e.g., '/output/file.txt')."
-                ),
-                parameters_json_schema=DeleteFileArgs.model_json_schema(),
-            ),
-            max_retries=self._max_retries,
-            args_validator=TypeAdapter(DeleteFileArgs).validator,
-        )
-
-        tools["move_file"] = ToolsetTool(
-            toolset=self,
-            tool_def=ToolDefinition(
-                name="move_file",
-                description=(
-                    "Move or rename a file within the sandbox. "
-                    "Parent directories of destination are created automatically. "
-                    "Path format: '/mount/path' (e.g., '/output/file.txt')."
-                ),
-                parameters_json_schema=MoveFileArgs.model_json_schema(),
-            ),
-            max_retries=self._max_retries,
-            args_validator=TypeAdapter(MoveFileArgs).validator,
-        )
-
-        tools["copy_file"] = ToolsetTool(
-            toolset=self,
-            tool_def=ToolDefinition(
-                name="copy_file",
-                description=(
-                    "Copy a file within the sandbox. "
-                    "Parent directories of destination are created automatically. "
-                    "Path format: '/mount/path' (e.g., '/output/file.txt')."
-                ),
-                parameters_json_schema=CopyFileArgs.model_json_schema(),
-            ),
-            max_retries=self._max_retries,
-            args_validator=TypeAdapter(CopyFileArgs).validator,
-        )
-
-        return tools
+        if self._tools is None:
+            self._tools = {
+                tool_def.name: ToolsetTool(
+                    toolset=self,
+                    tool_def=tool_def,
+                    max_retries=self._max_retries,
+                    args_validator=validator,
+                )
+                for tool_def, validator in _tool_definitions()
+            }
+        return dict(self._tools)
 
     async def call_tool(
         self,
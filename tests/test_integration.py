@@ -1,6 +1,9 @@
 """Integration tests with PydanticAI Agent and TestModel for filesystem sandbox."""
 import asyncio
-from unittest.mock import AsyncMock, MagicMock
+import pickle
+import sys
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from pydantic_ai import Agent
@@ -77,6 +80,22 @@ class TestFileSandboxStandalone:
         assert "write_file" in tools
         assert "list_files" in tools
 
+    def test_tools_are_built_once_per_toolset(self, tmp_path):
+        """Repeated get_tools() calls share definitions but return fresh dicts."""
+        config = SandboxConfig(
+            mounts=[Mount(host_path=tmp_path, mount_point="/data", mode="rw")]
+        )
+        toolset = FileSystemToolset(Sandbox(config), max_retries=3)
+        ctx = MagicMock(spec=RunContext)
+
+        first = asyncio.run(toolset.get_tools(ctx))
+        second = asyncio.run(toolset.get_tools(ctx))
+
+        assert first is not second
+        assert first["read_file"] is second["read_file"]
+        assert first["read_file"].toolset is toolset
+        assert first["read_file"].max_retries == 3
+
     def test_agent_can_call_list_files(self, tmp_path):
         """Test that agent can call list_files tool (doesn't validate paths strictly)."""
         sandbox_root = tmp_path / "files"
@@ -677,6 +696,190 @@ class TestNeedsApprovalProtocol:
         result = sandbox.needs_approval("list_files", {}, ctx)
         assert result.is_needs_approval
 
+    def test_needs_approval_pre_approved_by_config(self, tmp_path):
+        """A per-tool pre_approved config entry skips the path checks."""
+        sandbox_root = tmp_path / "output"
+        sandbox_root.mkdir()
+
+        config = SandboxConfig(
+            mounts=[Mount(host_path=sandbox_root, mount_point="/output", mode="rw")]
+        )
+        sandbox = ApprovableFileSystemToolset(Sandbox(config))
+        ctx = MagicMock(spec=RunContext)
+        args = {"path": "/output/test.txt", "content": "x"}
+
+        approval_config = {"write_file": {"pre_approved": True}}
+        assert sandbox.needs_approval("write_file", args, ctx, approval_config).is_pre_approved
+        approval_config = {"write_file": {"pre_approved": False}}
+        assert sandbox.needs_approval("write_file", args, ctx, approval_config).is_needs_approval
+        approval_config = {"read_file": {"pre_approved": True}}
+        assert sandbox.needs_approval("write_file", args, ctx, approval_config).is_needs_approval
+
+    def test_needs_approval_list_root_respects_derived_roots(self, tmp_path):
+        """Listing '/' only considers roots the (derived) sandbox can read."""
+        public_root = tmp_path / "public"
+        secret_root = tmp_path / "secret"
+        public_root.mkdir()
+        secret_root.mkdir()
+
+        config = SandboxConfig(
+            mounts=[
+                Mount(host_path=public_root, mount_point="/public", mode="ro"),
+                Mount(
+                    host_path=secret_root,
+                    mount_point="/secret",
+                    mode="ro",
+                    read_approval=True,
+                ),
+            ]
+        )
+        parent = Sandbox(config)
+        child = parent.derive(allow_read="/public")
+        ctx = MagicMock(spec=RunContext)
+
+        assert parent.any_root_needs_read_approval
+        assert ApprovableFileSystemToolset(parent).needs_approval(
+            "list_files", {"path": "/"}, ctx
+        ).is_needs_approval
+        assert not child.any_root_needs_read_approval
+        assert ApprovableFileSystemToolset(child).needs_approval(
+            "list_files", {"path": "/"}, ctx
+        ).is_pre_approved
+
+    def test_needs_approval_missing_argument_blocked(self, tmp_path):
+        """Tools with required path arguments are blocked when one is missing."""
+        sandbox_root = tmp_path / "output"
+        sandbox_root.mkdir()
+
+        config = SandboxConfig(
+            mounts=[Mount(host_path=sandbox_root, mount_point="/output", mode="rw")]
+        )
+        sandbox = ApprovableFileSystemToolset(Sandbox(config))
+
+        ctx = MagicMock(spec=RunContext)
+        result = sandbox.needs_approval("delete_file", {}, ctx)
+        assert result.is_blocked
+        assert "'path'" in result.block_reason
+
+        result = sandbox.needs_approval("move_file", {"source": "/output/a.txt"}, ctx)
+        assert result.is_blocked
+        assert "'destination'" in result.block_reason
+
+        result = sandbox.needs_approval("write_file", {"path": None, "content": "x"}, ctx)
+        assert result.is_blocked
+        assert "'path'" in result.block_reason
+
+    def test_needs_approval_move_and_copy(self, tmp_path):
+        """move_file needs a writable source; copy_file only a readable one."""
+        input_root = tmp_path / "input"
+        output_root = tmp_path / "output"
+        input_root.mkdir()
+        output_root.mkdir()
+
+        config = SandboxConfig(
+            mounts=[
+                Mount(host_path=input_root, mount_point="/input", mode="ro"),
+                Mount(
+                    host_path=output_root,
+                    mount_point="/output",
+                    mode="rw",
+                    write_approval=False,
+                ),
+            ]
+        )
+        sandbox = ApprovableFileSystemToolset(Sandbox(config))
+        ctx = MagicMock(spec=RunContext)
+
+        args = {"source": "/input/a.txt", "destination": "/output/a.txt"}
+        assert sandbox.needs_approval("copy_file", args, ctx).is_pre_approved
+
+        result = sandbox.needs_approval("move_file", args, ctx)
+        assert result.is_blocked
+        assert result.block_reason == "Source is read-only: /input/a.txt"
+
+        args = {"source": "/output/a.txt", "destination": "/input/a.txt"}
+        result = sandbox.needs_approval("copy_file", args, ctx)
+        assert result.is_blocked
+        assert result.block_reason == "Destination is read-only: /input/a.txt"
+
+    def test_needs_approval_caches_path_lookups(self, tmp_path):
+        """Repeated approval checks for the same path resolve it only once."""
+        sandbox_root = tmp_path / "output"
+        sandbox_root.mkdir()
+
+        config = SandboxConfig(
+            mounts=[Mount(
+                host_path=sandbox_root,
+                mount_point="/output",
+                mode="ro",
+            )]
+        )
+        sandbox = Sandbox(config)
+        toolset = ApprovableFileSystemToolset(sandbox)
+        ctx = MagicMock(spec=RunContext)
+
+        with patch.object(Sandbox, "_lookup", autospec=True, side_effect=Sandbox._lookup) as spy:
+            for _ in range(3):
+                assert toolset.needs_approval("read_file", {"path": "/output/a.txt"}, ctx).is_pre_approved
+                assert toolset.needs_approval("write_file", {"path": "/output/a.txt"}, ctx).is_blocked
+
+        assert spy.call_count == 2
+
+    def test_concurrent_approval_checks_never_raise(self, tmp_path):
+        """Threads filling the verdict cache must not race on eviction."""
+        sandbox_root = tmp_path / "output"
+        sandbox_root.mkdir()
+
+        config = SandboxConfig(
+            mounts=[Mount(host_path=sandbox_root, mount_point="/output", mode="ro")]
+        )
+        toolset = ApprovableFileSystemToolset(Sandbox(config))
+        ctx = MagicMock(spec=RunContext)
+        errors: list[Exception] = []
+
+        def probe(worker: int) -> None:
+            try:
+                for i in range(8000):
+                    args = {"path": f"/output/w{worker}/f{i}.txt"}
+                    assert toolset.needs_approval("read_file", args, ctx).is_pre_approved
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=probe, args=(n,)) for n in range(8)]
+        # Switch threads as often as possible to make the race likely
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        assert errors == []
+
+    def test_toolset_pickles_after_lookups_are_cached(self, tmp_path):
+        """The approval lookup cache must not make the toolset unpicklable."""
+        sandbox_root = tmp_path / "output"
+        sandbox_root.mkdir()
+
+        config = SandboxConfig(
+            mounts=[Mount(
+                host_path=sandbox_root,
+                mount_point="/output",
+                mode="rw",
+                write_approval=True,
+            )]
+        )
+        toolset = ApprovableFileSystemToolset(Sandbox(config))
+        ctx = MagicMock(spec=RunContext)
+        assert toolset.needs_approval("write_file", {"path": "/output/a.txt"}, ctx).is_needs_approval
+
+        restored = pickle.loads(pickle.dumps(toolset))
+        assert restored.needs_approval("write_file", {"path": "/output/a.txt"}, ctx).is_needs_approval
+        assert restored.needs_approval("write_file", {"path": "/etc/passwd"}, ctx).is_blocked
+
 
 class TestGetApprovalDescription:
     """Tests for get_approval_description() method."""
@@ -98,6 +98,60 @@ class TestDeriveAllowlistsMultiPath:
         with pytest.raises(PathNotInSandboxError):
             child.resolve("/data/b.txt")
 
+    def test_readonly_inherited_through_grandchild(self, tmp_path: Path) -> None:
+        output_root = tmp_path / "output"
+        output_root.mkdir()
+
+        cfg = SandboxConfig(mounts=[Mount(host_path=output_root, mount_point="/output", mode="rw")])
+        child = Sandbox(cfg).derive(inherit=True, readonly=True)
+        grandchild = child.derive(inherit=True)
+
+        assert grandchild.can_read("/output/x.txt")
+        assert not grandchild.can_write("/output/x.txt")
+        assert not grandchild.needs_write_approval("/output/x.txt")
+        with pytest.raises(PathNotWritableError):
+            grandchild.get_path_config("/output/x.txt", op="write")
+        with pytest.raises(PathNotInSandboxError):
+            grandchild.get_path_config("/elsewhere/x.txt", op="write")
+
+    def test_check_paths_matches_get_path_config(self, tmp_path: Path) -> None:
+        data_root = tmp_path / "data"
+        (data_root / "sub").mkdir(parents=True)
+
+        cfg = SandboxConfig(mounts=[Mount(host_path=data_root, mount_point="/data", mode="rw")])
+        child = Sandbox(cfg).derive(allow_read="/data/sub")
+        paths = ["/data/sub/a.txt", "/data/b.txt", "/elsewhere/c.txt", "~/d.txt"]
+
+        assert child.check_paths(paths, op="read") == [
+            child.get_path_config("/data/sub/a.txt", op="read"),
+            None,
+            None,
+            None,
+        ]
+        assert child.check_paths(paths, op="write") == [None, None, None, None]
+
+    def test_allow_read_multiple_entries_across_mounts(self, tmp_path: Path) -> None:
+        data_root = tmp_path / "data"
+        docs_root = tmp_path / "docs"
+        for sub in ("a", "b", "c"):
+            (data_root / sub).mkdir(parents=True)
+        docs_root.mkdir()
+
+        cfg = SandboxConfig(
+            mounts=[
+                Mount(host_path=data_root, mount_point="/data", mode="ro"),
+                Mount(host_path=docs_root, mount_point="/docs", mode="ro"),
+            ]
+        )
+        child = Sandbox(cfg).derive(allow_read=["/data/a", "/data/b", "/docs"])
+
+        assert child.can_read("/data/a/x.txt")
+        assert child.can_read("/data/b/x.txt")
+        assert child.can_read("/docs/x.txt")
+        assert not child.can_read("/data/c/x.txt")
+        assert not child.can_read("/data/x.txt")
+        assert child.readable_roots == ["/data/a", "/data/b", "/docs"]
+
     def test_allow_write_implies_read(self, tmp_path: Path) -> None:
         output_root = tmp_path / "output"
         output_root.mkdir()
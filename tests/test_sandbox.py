@@ -1,11 +1,16 @@
 """Tests for filesystem sandbox functionality."""
 from __future__ import annotations
 
+import pickle
+import sys
+import threading
+
 import pytest
 
 from pydantic_ai_filesystem_sandbox import (
     EditError,
     FileSystemToolset,
+    FileTooLargeError,
     Mount,
     PathNotInSandboxError,
     PathNotWritableError,
@@ -39,6 +44,26 @@ class TestSandboxRead:
         with pytest.raises(SuffixNotAllowedError, match="suffix '.png' not allowed"):
             sandbox.read("/input/photo.png")
 
+    def test_read_suffix_check_is_case_insensitive(self, tmp_path):
+        """Suffix allowlists match regardless of case on either side."""
+        sandbox_root = tmp_path / "input"
+        sandbox_root.mkdir()
+        (sandbox_root / "NOTES.TXT").write_text("upper", encoding="utf-8")
+        (sandbox_root / "readme.md").write_text("lower", encoding="utf-8")
+
+        config = SandboxConfig(
+            mounts=[Mount(
+                host_path=sandbox_root,
+                mount_point="/input",
+                mode="ro",
+                suffixes=[".txt", ".MD"],
+            )]
+        )
+        sandbox = FileSystemToolset(Sandbox(config))
+
+        assert sandbox.read("/input/NOTES.TXT").content == "upper"
+        assert sandbox.read("/input/readme.md").content == "lower"
+
     def test_read_returns_read_result(self, tmp_path):
         """FileSystemToolset.read() returns ReadResult with content and metadata."""
         sandbox_root = tmp_path / "input"
@@ -133,6 +158,24 @@ class TestSandboxRead:
         assert result.offset == 10
         assert result.chars_read == 4
 
+    def test_read_window_spanning_chunks(self, tmp_path):
+        """Windows crossing internal read chunks match slicing the whole text."""
+        sandbox_root = tmp_path / "input"
+        sandbox_root.mkdir()
+        text = "".join(f"línea {i} — ✓\n" for i in range(20_000))
+        (sandbox_root / "big.txt").write_text(text, encoding="utf-8")
+
+        config = SandboxConfig(
+            mounts=[Mount(host_path=sandbox_root, mount_point="/input", mode="ro")]
+        )
+        sandbox = FileSystemToolset(Sandbox(config))
+
+        for offset, max_chars in [(0, 100), (65_500, 1_000), (70_000, 200_000), (len(text) + 5, 10)]:
+            result = sandbox.read("/input/big.txt", max_chars=max_chars, offset=offset)
+            assert result.content == text[offset:offset + max_chars]
+            assert result.total_chars == len(text)
+            assert result.truncated is (len(text[offset:]) > max_chars)
+
 
 class TestSandboxWrite:
     """Tests for FileSystemToolset.write() functionality."""
@@ -172,6 +215,54 @@ class TestSandboxWrite:
         with pytest.raises(PathNotWritableError, match="read-only"):
             sandbox.write("/input/test.txt", "content")
 
+    def test_write_large_multibyte_content(self, tmp_path):
+        """Content spanning internal write chunks round-trips as UTF-8 bytes."""
+        sandbox_root = tmp_path / "output"
+        sandbox_root.mkdir()
+        text = "".join(f"línea {i} — ✓\n" for i in range(20_000))
+        size = len(text.encode("utf-8"))
+
+        config = SandboxConfig(
+            mounts=[Mount(
+                host_path=sandbox_root,
+                mount_point="/output",
+                mode="rw",
+                max_file_bytes=size,
+            )]
+        )
+        sandbox = FileSystemToolset(Sandbox(config))
+
+        sandbox.write("/output/big.txt", text)
+        assert (sandbox_root / "big.txt").read_bytes() == text.encode("utf-8")
+
+        with pytest.raises(FileTooLargeError) as exc_info:
+            sandbox.write("/output/big.txt", text + "é")
+        assert exc_info.value.size == size + 2
+
+    @pytest.mark.parametrize("max_file_bytes", [None, 1_000_000])
+    def test_unencodable_write_leaves_file_untouched(self, tmp_path, max_file_bytes):
+        """A lone surrogate late in the content fails before the file is opened."""
+        sandbox_root = tmp_path / "output"
+        sandbox_root.mkdir()
+        (sandbox_root / "file.txt").write_text("original", encoding="utf-8")
+
+        config = SandboxConfig(
+            mounts=[Mount(
+                host_path=sandbox_root,
+                mount_point="/output",
+                mode="rw",
+                max_file_bytes=max_file_bytes,
+            )]
+        )
+        sandbox = FileSystemToolset(Sandbox(config))
+        bad = "x" * 200_000 + "\udc80"
+
+        with pytest.raises(UnicodeEncodeError):
+            sandbox.write("/output/file.txt", bad)
+        with pytest.raises(UnicodeEncodeError):
+            sandbox.edit("/output/file.txt", "original", bad)
+        assert (sandbox_root / "file.txt").read_text(encoding="utf-8") == "original"
+
 
 class TestSandboxListFiles:
     """Tests for FileSystemToolset.list_files() functionality."""
@@ -195,6 +286,57 @@ class TestSandboxListFiles:
         assert "/data/b.txt" in files
         assert "/data/sub/c.txt" in files
 
+    def test_list_files_default_pattern_matches_glob(self, tmp_path):
+        """The default '**/*' listing matches Path.glob('**/*') + is_file()."""
+        sandbox_root = tmp_path / "data"
+        sandbox_root.mkdir()
+        (sandbox_root / ".hidden").write_text("h")
+        (sandbox_root / "sub" / "deeper").mkdir(parents=True)
+        (sandbox_root / "sub" / "deeper" / "d.txt").write_text("d")
+        (sandbox_root / "empty").mkdir()
+        (sandbox_root / "file_link").symlink_to(sandbox_root / ".hidden")
+        (sandbox_root / "dir_link").symlink_to(sandbox_root / "sub")
+
+        config = SandboxConfig(
+            mounts=[Mount(host_path=sandbox_root, mount_point="/data", mode="ro")]
+        )
+        sandbox = FileSystemToolset(Sandbox(config))
+
+        expected = sorted(
+            f"/data/{p.relative_to(sandbox_root).as_posix()}"
+            for p in sandbox_root.glob("**/*")
+            if p.is_file()
+        )
+        assert sandbox.list_files("/data") == expected
+        assert sandbox.list_files("/data/sub") == ["/data/sub/deeper/d.txt"]
+        assert "/data/dir_link/deeper/d.txt" not in expected
+
+    def test_list_files_recursive_name_pattern_matches_glob(self, tmp_path):
+        """'**/<name>' patterns match Path.glob() with is_file()."""
+        sandbox_root = tmp_path / "data"
+        sandbox_root.mkdir()
+        (sandbox_root / "top.md").write_text("t")
+        (sandbox_root / ".hidden.md").write_text("h")
+        (sandbox_root / "notes.txt").write_text("n")
+        (sandbox_root / "sub" / "deeper").mkdir(parents=True)
+        (sandbox_root / "sub" / "deeper" / "d.md").write_text("d")
+        (sandbox_root / "sub" / "dir.md").mkdir()
+        (sandbox_root / "dir_link").symlink_to(sandbox_root / "sub")
+
+        config = SandboxConfig(
+            mounts=[Mount(host_path=sandbox_root, mount_point="/data", mode="ro")]
+        )
+        sandbox = FileSystemToolset(Sandbox(config))
+
+        for pattern in ("**/*.md", "**/d.?d", "**/[nt]*"):
+            expected = sorted(
+                f"/data/{p.relative_to(sandbox_root).as_posix()}"
+                for p in sandbox_root.glob(pattern)
+                if p.is_file()
+            )
+            assert sandbox.list_files("/data", pattern) == expected, pattern
+        assert sandbox.list_files("/data/sub", "**/*.md") == ["/data/sub/deeper/d.md"]
+
     def test_list_files_with_pattern(self, tmp_path):
         """FileSystemToolset.list_files() respects glob pattern."""
         sandbox_root = tmp_path / "data"
@@ -380,6 +522,22 @@ class TestNestedMounts:
         assert sandbox.resolve("/special/file.txt") == special_dir / "file.txt"
         assert sandbox.can_write("/special/file.txt")  # rw
 
+    def test_mount_matches_whole_segments_only(self, tmp_path):
+        """A mount point only matches at path segment boundaries."""
+        data_root = tmp_path / "data"
+        data_root.mkdir()
+
+        config = SandboxConfig(
+            mounts=[Mount(host_path=data_root, mount_point="/data", mode="ro")]
+        )
+        sandbox = Sandbox(config)
+
+        assert sandbox.resolve("/data") == data_root
+        assert sandbox.resolve("/data/") == data_root
+        assert sandbox.resolve("/data/sub/file.txt") == data_root / "sub" / "file.txt"
+        assert not sandbox.can_read("/database/file.txt")
+        assert not sandbox.can_read("/")
+
 
 class TestSandboxPathValidation:
     """Tests for path validation and security."""
@@ -732,3 +890,109 @@ class TestSandboxCopy:
 
         with pytest.raises(PathNotWritableError, match="read-only"):
             sandbox.copy("/input/file.txt", "/readonly/file.txt")
+
+    def test_copy_respects_destination_size_limit(self, tmp_path):
+        """FileSystemToolset.copy() checks the source size against both mounts."""
+        input_root = tmp_path / "input"
+        input_root.mkdir()
+        (input_root / "file.txt").write_text("x" * 100, encoding="utf-8")
+        output_root = tmp_path / "output"
+        output_root.mkdir()
+
+        config = SandboxConfig(
+            mounts=[
+                Mount(host_path=input_root, mount_point="/input", mode="ro"),
+                Mount(
+                    host_path=output_root,
+                    mount_point="/output",
+                    mode="rw",
+                    max_file_bytes=50,
+                ),
+            ]
+        )
+        sandbox = FileSystemToolset(Sandbox(config))
+
+        with pytest.raises(FileTooLargeError) as exc_info:
+            sandbox.copy("/input/file.txt", "/output/file.txt")
+        assert exc_info.value.path == "/output/file.txt"
+        assert exc_info.value.size == 100
+        assert not (output_root / "file.txt").exists()
+        with pytest.raises(IsADirectoryError):
+            sandbox.copy("/input", "/output/dir")
+
+
+class TestPickling:
+    """Tests that sandboxes and toolsets survive a pickle round-trip."""
+
+    def test_sandbox_and_toolset_pickle_round_trip(self, tmp_path):
+        """Memoized lookups must not make sandboxes unpicklable."""
+        data_root = tmp_path / "data"
+        (data_root / "sub").mkdir(parents=True)
+        (data_root / "sub" / "file.txt").write_text("hello", encoding="utf-8")
+
+        config = SandboxConfig(
+            mounts=[Mount(host_path=data_root, mount_point="/data", mode="rw")]
+        )
+        sandbox = Sandbox(config)
+        assert sandbox.can_read("/data/sub/file.txt")  # populate the caches
+        child = sandbox.derive(allow_read="/data/sub", allow_write=[])
+
+        restored_child = pickle.loads(pickle.dumps(child))
+        assert restored_child.can_read("/data/sub/file.txt")
+        assert not restored_child.can_read("/data/other.txt")
+        assert not restored_child.can_write("/data/sub/file.txt")
+
+        restored = pickle.loads(pickle.dumps(sandbox))
+        assert restored.can_write("/data/sub/file.txt")
+
+        toolset = pickle.loads(pickle.dumps(FileSystemToolset(sandbox)))
+        assert toolset.read("/data/sub/file.txt").content == "hello"
+
+
+class TestConcurrency:
+    """Tests for sandboxes shared between threads."""
+
+    def test_concurrent_lookups_past_cache_size_never_raise(self, tmp_path):
+        """Threads filling the shared mount-lookup cache must not race on eviction."""
+        data_root = tmp_path / "data"
+        data_root.mkdir()
+        sandbox = Sandbox(
+            SandboxConfig(mounts=[Mount(host_path=data_root, mount_point="/data")])
+        )
+        child = sandbox.derive(allow_read="/data")
+        errors: list[Exception] = []
+
+        def probe(worker: int) -> None:
+            try:
+                for i in range(8000):
+                    target = sandbox if i % 2 else child
+                    target.can_read(f"/data/w{worker}/f{i}.txt")
+                    target.can_read(f"/other/w{worker}/f{i}.txt")
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=probe, args=(n,)) for n in range(8)]
+        # Switch threads as often as possible to make the race likely
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        assert errors == []
+
+    def test_long_paths_are_not_memoized(self, tmp_path):
+        """Model-supplied paths of any length must not pile up in the cache."""
+        data_root = tmp_path / "data"
+        data_root.mkdir()
+        sandbox = Sandbox(
+            SandboxConfig(mounts=[Mount(host_path=data_root, mount_point="/data")])
+        )
+
+        assert sandbox.can_read("/data/" + "a" * 10_000)
+        assert sandbox.can_read("/data/short.txt")
+        assert list(sandbox._find_mount_cache) == ["/data/short.txt"]
@@ -1,9 +1,11 @@
 """Regression tests for security boundary behaviors."""
 from __future__ import annotations
 
+import time
 from pathlib import Path
 
 import pytest
+from pydantic import ValidationError
 
 from pydantic_ai_filesystem_sandbox import (
     FileSystemToolset,
@@ -91,3 +93,134 @@ def test_mount_host_path_overlap_is_disallowed(tmp_path: Path) -> None:
     )
     with pytest.raises(ValueError, match="overlap"):
         Sandbox(config)
+
+
+def test_symlink_swap_after_lookup_is_still_rejected(tmp_path: Path) -> None:
+    """Cached path lookups must not skip host resolution on later calls."""
+    output_root = tmp_path / "output"
+    (output_root / "sub").mkdir(parents=True)
+    outside = tmp_path / "outside"
+    outside.mkdir()
+
+    config = SandboxConfig(
+        mounts=[Mount(host_path=output_root, mount_point="/output", mode="rw")]
+    )
+    sandbox = Sandbox(config)
+    assert sandbox.can_write("/output/sub/file.txt")
+
+    (output_root / "sub").rmdir()
+    (output_root / "sub").symlink_to(outside, target_is_directory=True)
+
+    assert not sandbox.can_write("/output/sub/file.txt")
+    with pytest.raises(PathNotInSandboxError):
+        FileSystemToolset(sandbox).write("/output/sub/file.txt", "x")
+    assert not (outside / "file.txt").exists()
+
+
+def test_symlink_to_sibling_with_shared_prefix_is_rejected(tmp_path: Path) -> None:
+    """Containment is checked per path segment, not as a raw string prefix."""
+    data_root = tmp_path / "data"
+    data_root.mkdir()
+    sibling = tmp_path / "data-private"
+    sibling.mkdir()
+    (sibling / "secret.txt").write_text("secret", encoding="utf-8")
+    (data_root / "link").symlink_to(sibling, target_is_directory=True)
+
+    config = SandboxConfig(
+        mounts=[Mount(host_path=data_root, mount_point="/data", mode="ro")]
+    )
+    sandbox = Sandbox(config)
+
+    assert not sandbox.can_read("/data/link/secret.txt")
+    assert not sandbox.can_read("/data/../data-private/secret.txt")
+    assert sandbox.can_read("/data/sub/../file.txt")
+
+
+def test_mount_config_cannot_be_mutated_after_sandbox_creation(tmp_path: Path) -> None:
+    """Sandbox precomputes state from its mounts; changing them would desync it."""
+    mount = Mount(host_path=tmp_path, mount_point="/data/", mode="ro")
+    config = SandboxConfig(mounts=[mount])
+    Sandbox(config)
+
+    assert mount.mount_point == "/data"
+    with pytest.raises(ValidationError):
+        mount.mode = "rw"
+    with pytest.raises(ValidationError):
+        config.mounts = []
+    assert config.mounts == (mount,)
+    with pytest.raises(AttributeError):
+        config.mounts.append(mount)
+
+
+def test_misspelled_mount_option_is_rejected(tmp_path: Path) -> None:
+    """A typo in an approval flag must not silently drop the approval."""
+    with pytest.raises(ValidationError):
+        Mount(host_path=tmp_path, mount_point="/data", mode="rw", write_aproval=True)
+    with pytest.raises(ValidationError):
+        SandboxConfig(
+            mounts=[Mount(host_path=tmp_path, mount_point="/data")],
+            paths={"data": str(tmp_path)},
+        )
+
+
+def test_suffix_check_follows_copied_and_constructed_mounts(tmp_path: Path) -> None:
+    """check_suffix() enforces the suffixes of the Mount it is given."""
+    mount = Mount(host_path=tmp_path, mount_point="/data", suffixes=[".md"])
+    sandbox = Sandbox(SandboxConfig(mounts=[mount]))
+    txt = tmp_path / "notes.txt"
+
+    sandbox.check_suffix(tmp_path / "a.MD", mount, virtual_path="/data/a.MD")
+    with pytest.raises(SuffixNotAllowedError):
+        sandbox.check_suffix(txt, mount, virtual_path="/data/notes.txt")
+
+    # Suffixes are stored as a tuple, so they cannot be changed in place
+    # behind the sandbox's back.
+    assert mount.suffixes == (".md",)
+    with pytest.raises(AttributeError):
+        mount.suffixes.remove(".md")
+    hash(mount)
+
+    narrowed = mount.model_copy(update={"suffixes": [".py"]})
+    with pytest.raises(SuffixNotAllowedError):
+        sandbox.check_suffix(tmp_path / "a.md", narrowed, virtual_path="/data/a.md")
+
+    constructed = Mount.model_construct(
+        host_path=tmp_path, mount_point="/data", suffixes=[".md"]
+    )
+    with pytest.raises(SuffixNotAllowedError):
+        sandbox.check_suffix(txt, constructed, virtual_path="/data/notes.txt")
+
+
+def test_allowlist_prefix_matches_whole_directories_only(tmp_path: Path) -> None:
+    """An allowlist entry for /data/sub must not admit /data/sub-other."""
+    data_root = tmp_path / "data"
+    (data_root / "sub").mkdir(parents=True)
+    (data_root / "sub-other").mkdir()
+
+    config = SandboxConfig(
+        mounts=[Mount(host_path=data_root, mount_point="/data", mode="rw")]
+    )
+    child = Sandbox(config).derive(allow_write="/data/sub")
+
+    assert child.can_read("/data/sub")
+    assert child.can_write("/data/sub/a.txt")
+    assert not child.can_read("/data/sub-other/a.txt")
+    assert not child.can_write("/data/sub-other/a.txt")
+
+
+def test_deep_path_lookup_is_not_quadratic(tmp_path: Path) -> None:
+    """Mount matching cost must not grow with the square of path depth."""
+    sandbox = Sandbox(
+        SandboxConfig(
+            mounts=[
+                Mount(host_path=tmp_path / "data", mount_point="/data"),
+                Mount(host_path=tmp_path / "docs", mount_point="/data/docs"),
+            ]
+        )
+    )
+    deep = "/nomount/" + "a/" * 200_000
+
+    start = time.perf_counter()
+    assert not sandbox.can_read(deep)
+    assert not sandbox.can_write(deep + "x.txt")
+    assert time.perf_counter() - start < 0.5